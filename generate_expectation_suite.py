@@ -1,8 +1,9 @@
 import argparse
 
 from pyspark_data_quality.libs.utils import Environment
-from pyspark_data_quality.validate_module.expectation_suite_generator import ValidationSuiteGenerator
-from pyspark_data_quality.validate_module.expectations.expectatione_rules import (
+from pyspark_data_quality.validate_module.expectation_suit_generator import ValidationSuiteGenerator
+from pyspark_data_quality.validate_module.suite_compiler import SuiteCompiler
+from pyspark_data_quality.validate_module.expectations.expectations_rule import (
     OrderedColumnsMatchExpectation, 
     ColumnsMatchExpectation,
     RowCountBetweenExpectation, 
@@ -59,13 +60,25 @@ def main() -> None:
         choices=list(Environment),
         help="Which environment?",
     )
+    parser.add_argument(
+        "--suite-definitions",
+        action="store",
+        type=str,
+        default=None,
+        help="Directory of declarative json/yaml suite definitions",
+    )
     args = parser.parse_args()
 
     
     ## upload expectation json to s3
-    SuiteGenerate(
-        env=args.environment.value
-    ).run()
+    if args.suite_definitions:
+        SuiteCompiler(env=args.environment.value) \
+            .add_directory(args.suite_definitions) \
+            .save_to_store()
+    else:
+        SuiteGenerate(
+            env=args.environment.value
+        ).run()
 
 
 if __name__ == "__main__":
@@ -5,8 +5,9 @@ import pyspark.sql.functions as F
 from pyspark.sql import DataFrame
 from pyspark.sql import SparkSession
 
-from pyspark_data_quality.libs.utils import Environment
+from pyspark_data_quality.libs.utils import Environment, s3_client
 from pyspark_data_quality.validate_module.base.data_asset import DataAssetName
+from pyspark_data_quality.validate_module.custom.backfill import BackfillManifest, BackfillRunner
 from pyspark_data_quality.validate_module.custom.validator import Validator
 
 @dataclass
@@ -18,10 +19,15 @@ class TransformExample:
     s3_destination_bucket: str
     s3_destination_prefix: str
     logger: str
+    s3_staging_prefix: str = None
     
     def __post_init__(self):
+        if self.s3_staging_prefix is None:
+            self.s3_staging_prefix = f"{self.s3_destination_prefix.rstrip('/')}_staging"
+        
         self._input_path = f"s3://{self.s3_source_bucket}/{self.s3_source_prefix}"
         self._output_path = f"s3://{self.s3_destination_bucket}/{self.s3_destination_prefix}"
+        self._staging_path = f"s3://{self.s3_destination_bucket}/{self.s3_staging_prefix}"
     
     def load_source_data(self) -> DataFrame:
         _source_df = self.spark_session.read.format("parquet") \
@@ -44,18 +50,69 @@ class TransformExample:
         return _processed_df
     
     def save_processed_data(self, 
-                               _df: DataFrame) -> None:
+                               _df: DataFrame,
+                               output_path: str = None) -> None:
         _df.write.format("parquet") \
                 .mode("overwrite")\
                 .partitionBy("dt")\
-                .save(self._output_path)
+                .save(output_path or self._output_path)
                 
         self.logger.info('Completely save to s3.')
     
-    def run(self):
-        _source_df = self.load_source_data()
-        _processed_df = self.transform_logics(_source_df)
+    def load_staged_data(self, _expected_df: DataFrame) -> DataFrame:
+        """
+            load staged parquet, the schema is resolved from parquet footers and
+            dt partition directories only, so a column name or type mismatch 
+            fails before any data is scanned
+        """
+        _staged_df = self.spark_session.read.format("parquet") \
+                                            .load(self._staging_path)
+        
+        staged_fields = {(f.name, f.dataType) for f in _staged_df.schema.fields}
+        expected_fields = {(f.name, f.dataType) for f in _expected_df.schema.fields}
+        if staged_fields != expected_fields:
+            raise RuntimeError(
+                f"Staged schema {sorted(map(str, staged_fields - expected_fields))} "
+                f"does not match expected {sorted(map(str, expected_fields - staged_fields))}")
+        
+        return _staged_df.select(_expected_df.columns)
+    
+    def promote_staged_data(self) -> None:
+        """
+            move every staged dt partition to destination prefix.
+            new files are copied before old files are removed, so the partition is never empty
+        """
+        client = s3_client()
+        staging_prefix = f"{self.s3_staging_prefix.rstrip('/')}/"
+        destination_prefix = f"{self.s3_destination_prefix.rstrip('/')}/"
+        
+        for partition_prefix in client.list_common_prefixes(
+                self.s3_destination_bucket, staging_prefix):
+            partition = partition_prefix[len(staging_prefix):]
+            staged_keys = client.list_object_keys(
+                self.s3_destination_bucket, partition_prefix)
+            old_keys = set(client.list_object_keys(
+                self.s3_destination_bucket, destination_prefix + partition))
+            
+            new_keys = set()
+            for staged_key in staged_keys:
+                destination_key = destination_prefix + staged_key[len(staging_prefix):]
+                client.copy_object(
+                    self.s3_destination_bucket, staged_key, destination_key)
+                new_keys.add(destination_key)
+            
+            client.delete_objects(
+                self.s3_destination_bucket, sorted(old_keys - new_keys))
+            
+            self.logger.info(f'Promote {partition} to destination.')
         
+        client.delete_objects(
+            self.s3_destination_bucket,
+            client.list_object_keys(self.s3_destination_bucket, staging_prefix))
+        
+        self.logger.info('Completely promote staged data.')
+    
+    def validate(self, _df: DataFrame) -> Validator:
         ## Execute greate_expectation data quality and validation
         data_asset_name = DataAssetName(
             table_name='custom_table',
@@ -64,15 +121,73 @@ class TransformExample:
         validator = Validator(
             env=self.env,
             asset_name=str(data_asset_name), 
-            df=_processed_df, 
+            df=_df, 
             suite_name='custom_table_validation_suite')
         validator.run()
+        self.logger.info(f"Validation executed with {validator.engine} engine.")
+        self.logger.info(f"Validation partition metrics: {validator.partition_metrics}")
+        
+        return validator
+    
+    def run(self):
+        _source_df = self.load_source_data()
+        _processed_df = self.transform_logics(_source_df)
+        validator = self.validate(_processed_df)
         
         if validator.status:
             self.save_processed_data(_processed_df)
             self.logger.info("Creation table is completed.")
         else:
             self.logger.info("Validation Failed and alert to Slack.")
+    
+    def run_validate_after_write(self):
+        """
+            write once to staging prefix, validate the written parquet 
+            and promote it to destination only when validation is passed.
+            staged data is cached so every expectation reuses one scan of the parquet
+        """
+        _source_df = self.load_source_data()
+        _processed_df = self.transform_logics(_source_df)
+        self.save_processed_data(_processed_df, output_path=self._staging_path)
+        _staged_df = self.load_staged_data(_processed_df).persist()
+        
+        try:
+            validator = self.validate(_staged_df)
+            
+            if validator.status:
+                self.promote_staged_data()
+                self.logger.info("Creation table is completed.")
+            else:
+                self.logger.info("Validation Failed and alert to Slack.")
+        finally:
+            _staged_df.unpersist()
+    
+    def run_backfill(self, 
+                     start_dt: str, 
+                     end_dt: str, 
+                     manifest_path: str,
+                     max_concurrency: int = 4):
+        """
+            validate every dt partition between start_dt and end_dt,
+            dates already recorded in manifest are skipped
+        """
+        _source_df = self.load_source_data()
+        
+        runner = BackfillRunner(
+            env=self.env,
+            table_name='custom_table',
+            suite_name='custom_table_validation_suite',
+            load_df=lambda dt: self.transform_logics(
+                _source_df.filter(F.col('dt') == dt)),
+            manifest=BackfillManifest(path=manifest_path),
+            max_concurrency=max_concurrency,
+            logger=self.logger)
+        statuses = runner.run(start_dt, end_dt)
+        
+        failed_dates = [dt for dt, status in statuses.items() if status is False]
+        errored_dates = [dt for dt, status in statuses.items() if status is None]
+        self.logger.info(f"Backfill validation failed dates: {failed_dates}")
+        self.logger.info(f"Backfill validation errored dates, retried on next run: {errored_dates}")
 
 
 def main() -> None:
@@ -85,8 +200,44 @@ def main() -> None:
         choices=list(Environment),
         help="Which environment?",
     )
+    parser.add_argument(
+        "--validate-after-write",
+        action="store_true",
+        help="Write to staging prefix, validate written data then promote it",
+    )
+    parser.add_argument(
+        "--backfill-start",
+        action="store",
+        type=str,
+        default=None,
+        help="First dt to validate in backfill mode, e.g. 2022-01-01",
+    )
+    parser.add_argument(
+        "--backfill-end",
+        action="store",
+        type=str,
+        default=None,
+        help="Last dt to validate in backfill mode, e.g. 2022-12-31",
+    )
+    parser.add_argument(
+        "--backfill-manifest",
+        action="store",
+        type=str,
+        default="s3://destination_bucket/your/backfill/manifest.json",
+        help="Local path or s3 uri of backfill manifest",
+    )
+    parser.add_argument(
+        "--backfill-concurrency",
+        action="store",
+        type=int,
+        default=4,
+        help="Number of dates validated concurrently",
+    )
     args = parser.parse_args()
     
+    if bool(args.backfill_start) != bool(args.backfill_end):
+        parser.error("--backfill-start and --backfill-end must be given together")
+    
     spark = (
         SparkSession.builder.appName("Pysprk data quality Example")
         .config("spark.serializer", "org.apache.spark.serializer.KryoSerializer")
@@ -106,7 +257,16 @@ def main() -> None:
         logger=logger
     )
     
-    example_transform.run()
+    if args.backfill_start and args.backfill_end:
+        example_transform.run_backfill(
+            start_dt=args.backfill_start,
+            end_dt=args.backfill_end,
+            manifest_path=args.backfill_manifest,
+            max_concurrency=args.backfill_concurrency)
+    elif args.validate_after_write:
+        example_transform.run_validate_after_write()
+    else:
+        example_transform.run()
 
 if __name__ == "__main__":
     main()
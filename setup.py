@@ -6,6 +6,7 @@ REQUIRED_PACKAGES = [
     "pendulum==2.1.2",
     "slack_sdk==3.13.0",
     "great-expectations==0.15.7",
+    "ruamel.yaml==0.17.17",
     "pandas==1.3.4"
 ]
 
@@ -49,6 +49,53 @@ class s3_client:
         
         if response["ResponseMetadata"].get("HTTPStatusCode") != 200:
             raise RuntimeError('Upload data s3 have some problems!')
+
+    def list_object_keys(self,
+                         bucket_name: str,
+                         prefix: str) -> List[str]:
+        
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        object_keys = []
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+            object_keys.extend(obj["Key"] for obj in page.get("Contents", []))
+        
+        return object_keys
+    
+    def list_common_prefixes(self,
+                             bucket_name: str,
+                             prefix: str) -> List[str]:
+        
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        common_prefixes = []
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix, Delimiter="/"):
+            common_prefixes.extend(p["Prefix"] for p in page.get("CommonPrefixes", []))
+        
+        return common_prefixes
+    
+    def copy_object(self,
+                    bucket_name: str,
+                    source_key_name: str,
+                    destination_key_name: str) -> None:
+        
+        self.s3_client.copy_object(
+            Bucket=bucket_name,
+            Key=destination_key_name,
+            CopySource={"Bucket": bucket_name, "Key": source_key_name}
+        )
+    
+    def delete_objects(self,
+                       bucket_name: str,
+                       object_key_names: List[str]) -> None:
+        
+        ## delete_objects accepts at most 1000 keys per request
+        for i in range(0, len(object_key_names), 1000):
+            response = self.s3_client.delete_objects(
+                Bucket=bucket_name,
+                Delete={"Objects": [{"Key": k} for k in object_key_names[i:i + 1000]]}
+            )
+            
+            if response.get("Errors"):
+                raise RuntimeError('Delete data from s3 have some problems!')
         
 class Environment(Enum):
     develop = "develop"
@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
+from typing import List, Union
 
 from pyspark.sql import DataFrame
 from great_expectations.checkpoint.types.checkpoint_result import CheckpointResult
@@ -12,7 +13,7 @@ class BaseValidator(ABC):
     """
     df: DataFrame
     asset_name: DataAssetName
-    suite_name: str
+    suite_name: Union[str, List[str]]
     env: str
 
     @abstractmethod
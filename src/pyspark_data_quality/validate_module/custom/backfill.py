@@ -0,0 +1,145 @@
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import pendulum
+from botocore.exceptions import ClientError
+from pyspark.sql import DataFrame
+
+from .validator import Validator
+from ..base.data_asset import DataAssetName
+from ...libs.utils import s3_client
+
+
+@dataclass
+class BackfillManifest:
+    """Record validated dates in a json manifest stored on local disk or S3
+
+    Args:
+        path (str): Local file path or s3://bucket/key of the manifest.
+    """
+    path: str
+    _completed: Dict[str, bool] = None
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+
+    @property
+    def _is_s3(self) -> bool:
+        return self.path.startswith("s3://")
+
+    def _s3_location(self):
+        bucket_name, _, object_key_name = self.path[len("s3://"):].partition("/")
+        return bucket_name, object_key_name
+
+    def load(self) -> Dict[str, bool]:
+        if self._is_s3:
+            bucket_name, object_key_name = self._s3_location()
+            try:
+                content = s3_client().get_object_content(bucket_name, object_key_name)
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "NoSuchKey":
+                    raise
+                content = None
+        else:
+            local_path = Path(self.path)
+            content = local_path.read_bytes() if local_path.exists() else None
+
+        self._completed = json.loads(content)["completed"] if content else {}
+
+        return dict(self._completed)
+
+    def _save(self) -> None:
+        data = {"completed": self._completed}
+
+        if self._is_s3:
+            bucket_name, object_key_name = self._s3_location()
+            s3_client().save_to_s3(
+                data=data,
+                bucket_name=bucket_name,
+                object_key_name=object_key_name)
+        else:
+            local_path = Path(self.path)
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = local_path.with_suffix(local_path.suffix + ".tmp")
+            tmp_path.write_text(json.dumps(data))
+            tmp_path.replace(local_path)
+
+    def mark_completed(self, dt: str, status: bool) -> None:
+        with self._lock:
+            if self._completed is None:
+                self.load()
+            self._completed[dt] = status
+            self._save()
+
+
+@dataclass
+class BackfillRunner:
+    """Validate a table over a date range, resuming from a manifest of completed dates
+
+    Only dates whose validation finished are recorded, so a restarted runner
+    re-validates the dates that were interrupted or raised and skips the others.
+
+    Args:
+        load_df (Callable[[str], DataFrame]): Build the DataFrame of a given dt.
+        max_concurrency (int): Number of dates validated concurrently.
+        logger (Any): Logger with info and error methods, python logging by default.
+    """
+    env: str
+    table_name: str
+    suite_name: Union[str, List[str]]
+    load_df: Callable[[str], DataFrame]
+    manifest: BackfillManifest
+    max_concurrency: int = 4
+    logger: Any = None
+
+    def __post_init__(self):
+        if self.logger is None:
+            self.logger = logging.getLogger(__name__)
+
+    def dates(self, start_dt: str, end_dt: str) -> List[str]:
+        period = pendulum.period(pendulum.parse(start_dt), pendulum.parse(end_dt))
+
+        return [d.to_date_string() for d in period.range("days")]
+
+    def validate_date(self, dt: str) -> bool:
+        validator = Validator(
+            env=self.env,
+            asset_name=str(DataAssetName(table_name=self.table_name, dt=dt)),
+            df=self.load_df(dt),
+            suite_name=self.suite_name)
+        validator.run()
+
+        self.manifest.mark_completed(dt, validator.status)
+
+        return validator.status
+
+    def run(self, start_dt: str, end_dt: str) -> Dict[str, Optional[bool]]:
+        """Validate every pending date and return the status of all dates in range
+
+        Dates whose validation raised are logged, left out of the manifest
+        and reported with a None status.
+        """
+        completed = self.manifest.load()
+        dates = self.dates(start_dt, end_dt)
+        pending = [dt for dt in dates if dt not in completed]
+
+        statuses = dict(completed)
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures = {dt: executor.submit(self.validate_date, dt) for dt in pending}
+
+            for dt, future in futures.items():
+                try:
+                    statuses[dt] = future.result()
+                except Exception as e:
+                    statuses[dt] = None
+                    self.logger.error(f"Backfill validation of {dt} failed: {e!r}")
+
+        self.logger.info(
+            f"Backfill validated {len(pending)} dates, skipped {len(dates) - len(pending)} completed dates.")
+
+        return {dt: statuses.get(dt) for dt in dates}
@@ -0,0 +1,80 @@
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+
+import pyspark.sql.functions as F
+from pyspark.sql import DataFrame
+
+NO_CHANGE = "none"
+REPARTITION = "repartition"
+COALESCE = "coalesce"
+
+
+@dataclass
+class PartitionBalancer:
+    """Rebalance a DataFrame before validation when its partitions are skewed
+
+    Args:
+        skew_threshold (float): Ratio of the largest partition to the mean partition size
+            above which the DataFrame is repartitioned.
+        target_rows_per_partition (int): Rows per partition used to grow the partitioning
+            of large skewed DataFrames. Skewed DataFrames never get fewer partitions.
+        min_rows_per_partition (int): Mean partition size below which partitions are
+            coalesced, never below the default parallelism of the cluster.
+    """
+    skew_threshold: float = 2.0
+    target_rows_per_partition: int = 1000000
+    min_rows_per_partition: int = 10000
+
+    def partition_counts(self, df: DataFrame) -> Dict[int, int]:
+        rows = df.groupBy(F.spark_partition_id().alias("partition_id")) \
+                 .count() \
+                 .collect()
+
+        return {r["partition_id"]: r["count"] for r in rows}
+
+    def plan(self,
+             counts: Dict[int, int],
+             num_partitions: int,
+             parallelism: int) -> Dict[str, Any]:
+        """Decide how to rebalance from the row count of each partition"""
+        total_rows = sum(counts.values())
+        max_rows = max(counts.values(), default=0)
+        mean_rows = total_rows / num_partitions if num_partitions else 0
+        skew = max_rows / mean_rows if mean_rows else 1.0
+
+        if total_rows == 0:
+            decision, target_partitions = NO_CHANGE, num_partitions
+        elif skew > self.skew_threshold:
+            decision = REPARTITION
+            target_partitions = max(
+                num_partitions, math.ceil(total_rows / self.target_rows_per_partition))
+        elif mean_rows < self.min_rows_per_partition and num_partitions > parallelism:
+            decision = COALESCE
+            target_partitions = max(
+                parallelism, math.ceil(total_rows / self.min_rows_per_partition))
+        else:
+            decision, target_partitions = NO_CHANGE, num_partitions
+
+        return {
+            "decision": decision,
+            "num_partitions": num_partitions,
+            "target_partitions": target_partitions,
+            "parallelism": parallelism,
+            "total_rows": total_rows,
+            "max_partition_rows": max_rows,
+            "skew": skew,
+        }
+
+    def balance(self, df: DataFrame) -> Tuple[DataFrame, Dict[str, Any]]:
+        metrics = self.plan(
+            counts=self.partition_counts(df),
+            num_partitions=df.rdd.getNumPartitions(),
+            parallelism=df.sql_ctx.sparkSession.sparkContext.defaultParallelism)
+
+        if metrics["decision"] == REPARTITION:
+            df = df.repartition(metrics["target_partitions"])
+        elif metrics["decision"] == COALESCE:
+            df = df.coalesce(metrics["target_partitions"])
+
+        return df, metrics
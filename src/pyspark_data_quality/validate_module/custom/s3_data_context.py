@@ -38,6 +38,17 @@ class S3Context(BaseContext):
                         "batch_identifiers": ["default_identifier_name"]
                     }
                 }
+            ),
+            "pandas_runtime_data_source": DatasourceConfig(
+                class_name="Datasource",
+                execution_engine={
+                    "class_name": "PandasExecutionEngine"},
+                data_connectors={
+                    "default_runtime_data_connector_name": {
+                        "class_name": "RuntimeDataConnector",
+                        "batch_identifiers": ["default_identifier_name"]
+                    }
+                }
             )
         }
 
@@ -1,43 +1,198 @@
-from dataclasses import dataclass
+import copy
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 
+from pyspark.sql import DataFrame
 from great_expectations.checkpoint.types.checkpoint_result import CheckpointResult
+from great_expectations.core import (
+    ExpectationConfiguration,
+    ExpectationSuite,
+    ExpectationSuiteValidationResult
+)
 from great_expectations.core.batch import RuntimeBatchRequest
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.data_context.types.base import CheckpointConfig
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier
+)
+from great_expectations.data_context.util import instantiate_class_from_config
 
+from .partition_balancer import PartitionBalancer
 from .s3_data_context import S3Context
 from ..base.validator import BaseValidator
 from ...libs.utils import ssm_client
 
+SPARK_ENGINE = "spark"
+PANDAS_ENGINE = "pandas"
+ARROW_ENABLED_CONF = "spark.sql.execution.arrow.pyspark.enabled"
+## parquet plan statistics are compressed on-disk sizes, pandas frames are much larger
+IN_MEMORY_EXPANSION_FACTOR = 10
+## expectations checking spark type names, e.g. StringType, fail on the pandas engine
+SPARK_ONLY_EXPECTATION_TYPES = (
+    "expect_column_values_to_be_of_type",
+    "expect_column_values_to_be_in_type_list",
+)
+## the arrow conf is session wide, validators may convert concurrently (e.g. backfill)
+_ARROW_CONF_LOCK = threading.Lock()
+
+
+def _expectation_key(expectation_config: ExpectationConfiguration) -> str:
+    """Identify expectations that request the same metrics across suites
+
+    great_expectations substitutes evaluation parameters and adds the active
+    ``batch_id`` to the kwargs of evaluated configurations, so the key is built from
+    the raw kwargs without ``batch_id`` to match results back to suite expectations.
+    """
+    raw_kwargs = expectation_config.get_raw_configuration().kwargs
+    kwargs = {k: v for k, v in raw_kwargs.items() if k != "batch_id"}
+    return json.dumps(
+        {"expectation_type": expectation_config.expectation_type,
+         "kwargs": kwargs},
+        sort_keys=True,
+        default=str)
+
 
 @dataclass
 class Validator(BaseValidator):
     """A basic validator that perform validation using spark DataFrame
+
+    DataFrames below ``pandas_threshold_rows`` rows are collected through Arrow
+    and validated with the pandas execution engine, which avoids scheduling one
+    spark job per expectation for small tables. When the plan statistics have no
+    row count, the plan size times ``IN_MEMORY_EXPANSION_FACTOR`` is compared to
+    ``pandas_threshold_bytes`` instead. Suites containing one of
+    ``SPARK_ONLY_EXPECTATION_TYPES`` are always validated on the spark engine,
+    since their spark type names are not understood by the pandas engine.
+
+    ``suite_name`` may also be a list of suite names. Expectations of all suites
+    are then deduplicated and evaluated in a single validation, so shared metrics
+    like row count are computed once, and ``results`` holds one result per suite.
+    Store, data docs and slack actions still run for each suite result.
+
+    Before a spark validation, ``partition_balancer`` repartitions or coalesces
+    skewed DataFrames; its decision is reported by ``partition_metrics``.
+    The DataFrame is persisted while it is measured, unless it is already cached,
+    and a rebalanced copy is persisted and materialized once, so expectation jobs
+    do not repeat its shuffle. Set it to None to validate the DataFrame as is.
     """
+    pandas_threshold_rows: int = 10000
+    pandas_threshold_bytes: int = 10 * 1024 * 1024
+    partition_balancer: PartitionBalancer = field(default_factory=PartitionBalancer)
+    _partition_metrics: Dict[str, Any] = None
     _result: CheckpointResult = None
+    _suite_results: Dict[str, ExpectationSuiteValidationResult] = None
+    _engine: str = None
+    _persisted_df: DataFrame = None
     
     def __post_init__(self):
-        self.context = S3Context(env=self.env).build()
+        self._s3_context = S3Context(env=self.env)
+        self.context = self._s3_context.build()
         self.slack_alert_token = ssm_client().get_parameter_value(
             'ap-northeast-1',
             'your-ssm/slack-token')
 
+    def _plan_statistics(self) -> Tuple[Optional[int], Optional[int]]:
+        """Row count and size in bytes from the optimized spark plan statistics"""
+        try:
+            stats = self.df._jdf.queryExecution().optimizedPlan().stats()
+        except Exception:
+            return None, None
+
+        row_count = None
+        if stats.rowCount().isDefined():
+            row_count = int(stats.rowCount().get().toString())
+
+        return row_count, int(stats.sizeInBytes().toString())
+
+    def _has_spark_only_expectations(self) -> bool:
+        for name in self.suite_names:
+            suite = self.context.get_expectation_suite(expectation_suite_name=name)
+            if any(e.expectation_type in SPARK_ONLY_EXPECTATION_TYPES for e in suite.expectations):
+                return True
+
+        return False
+
+    def _select_engine(self) -> str:
+        row_count, size_in_bytes = self._plan_statistics()
+        if row_count is not None:
+            is_small = row_count < self.pandas_threshold_rows
+        elif size_in_bytes is not None:
+            is_small = size_in_bytes * IN_MEMORY_EXPANSION_FACTOR < self.pandas_threshold_bytes
+        else:
+            is_small = False
+
+        if is_small and not self._has_spark_only_expectations():
+            return PANDAS_ENGINE
+
+        return SPARK_ENGINE
+
+    def _to_pandas(self):
+        conf = self.df.sql_ctx.sparkSession.conf
+        with _ARROW_CONF_LOCK:
+            previous = conf.get(ARROW_ENABLED_CONF, None)
+            conf.set(ARROW_ENABLED_CONF, "true")
+            try:
+                return self.df.toPandas()
+            finally:
+                if previous is None:
+                    conf.unset(ARROW_ENABLED_CONF)
+                else:
+                    conf.set(ARROW_ENABLED_CONF, previous)
+
+    def _batch_data(self):
+        if self._engine == PANDAS_ENGINE:
+            return self._to_pandas()
+
+        if self.partition_balancer is None:
+            return self.df
+
+        persisted_input = not self.df.is_cached
+        if persisted_input:
+            self._persisted_df = self.df.persist()
+
+        df, self._partition_metrics = self.partition_balancer.balance(self.df)
+        if df is not self.df:
+            df = df.persist()
+            df.count()
+            if persisted_input:
+                self.df.unpersist()
+            self._persisted_df = df
+
+        return df
+
+    @property
+    def suite_names(self) -> List[str]:
+        if isinstance(self.suite_name, str):
+            return [self.suite_name]
+
+        return list(self.suite_name)
+
     def run(self) -> None:
-        batch_request = RuntimeBatchRequest(
-            datasource_name="spark_runtime_data_source",
-            data_connector_name="default_runtime_data_connector_name",
-            data_asset_name=self.asset_name,
-            batch_identifiers={"default_identifier_name": "some_identifier"},
-            runtime_parameters={"batch_data": self.df}
-        )
+        self._engine = self._select_engine()
+        self._partition_metrics = None
 
-        checkpoint_config = {
-            "name": f"{self.suite_name}_checkpoint",
-            "config_version": 1,
-            "class_name": "SimpleCheckpoint",
-            "expectation_suite_name": self.suite_name
-        }
+        try:
+            batch_request = RuntimeBatchRequest(
+                datasource_name=f"{self._engine}_runtime_data_source",
+                data_connector_name="default_runtime_data_connector_name",
+                data_asset_name=self.asset_name,
+                batch_identifiers={"default_identifier_name": "some_identifier"},
+                runtime_parameters={"batch_data": self._batch_data()}
+            )
 
-        self.context.add_checkpoint(**checkpoint_config)
+            if len(self.suite_names) > 1:
+                self._run_suites(batch_request)
+            else:
+                self._run_checkpoint(batch_request, self.suite_names[0])
+        finally:
+            if self._persisted_df is not None:
+                self._persisted_df.unpersist()
+                self._persisted_df = None
 
+    def _notification_actions(self) -> List[Dict[str, Any]]:
         slack_notification = {
             "name": "send_slack_notification_on_validation_result",
             "action": {
@@ -52,17 +207,131 @@ class Validator(BaseValidator):
             }
         }
 
+        return [slack_notification]
+
+    def _run_suites(self, batch_request: RuntimeBatchRequest) -> None:
+        """Validate all suites at once, then split the result and run actions per suite"""
+        suites = {
+            name: self.context.get_expectation_suite(expectation_suite_name=name)
+            for name in self.suite_names}
+
+        shared_expectations = {}
+        for suite in suites.values():
+            for expectation_config in suite.expectations:
+                shared_expectations.setdefault(
+                    _expectation_key(expectation_config), copy.deepcopy(expectation_config))
+
+        combined_suite = ExpectationSuite(
+            expectation_suite_name="__".join(self.suite_names),
+            expectations=list(shared_expectations.values()),
+            data_context=self.context)
+
+        validator = self.context.get_validator(
+            batch_request=batch_request,
+            expectation_suite=combined_suite)
+        run_id = RunIdentifier(run_name=f"{self.asset_name}")
+        combined_result = validator.validate(catch_exceptions=True, run_id=run_id)
+
+        results_by_key = {
+            _expectation_key(r.expectation_config): r
+            for r in combined_result.results}
+
+        action_list = self._s3_context.validation_operators()["action_list_operator"]["action_list"] \
+            + self._notification_actions()
+        actions = {
+            a["name"]: instantiate_class_from_config(
+                config=a["action"],
+                runtime_environment={"data_context": self.context},
+                config_defaults={"module_name": "great_expectations.checkpoint"})
+            for a in action_list}
+
+        run_results = {}
+        self._suite_results = {}
+        for name, suite in suites.items():
+            results = [results_by_key[_expectation_key(e)] for e in suite.expectations]
+            successful = sum(1 for r in results if r.success)
+            evaluated = len(results)
+
+            self._suite_results[name] = ExpectationSuiteValidationResult(
+                success=successful == evaluated,
+                results=results,
+                evaluation_parameters=combined_result.evaluation_parameters,
+                statistics={
+                    "evaluated_expectations": evaluated,
+                    "successful_expectations": successful,
+                    "unsuccessful_expectations": evaluated - successful,
+                    "success_percent": 100.0 * successful / evaluated if evaluated else None,
+                },
+                meta={**combined_result.meta, "expectation_suite_name": name})
+
+            expectation_suite_identifier = ExpectationSuiteIdentifier(
+                expectation_suite_name=name)
+            validation_result_id = ValidationResultIdentifier(
+                expectation_suite_identifier=expectation_suite_identifier,
+                run_id=run_id,
+                batch_identifier=validator.active_batch_id)
+
+            actions_results = {}
+            for action_name, action in actions.items():
+                action_result = action.run(
+                    validation_result_suite=self._suite_results[name],
+                    validation_result_suite_identifier=validation_result_id,
+                    data_asset=validator,
+                    payload=actions_results,
+                    expectation_suite_identifier=expectation_suite_identifier)
+                actions_results[action_name] = {} if action_result is None else action_result
+
+            run_results[validation_result_id] = {
+                "validation_result": self._suite_results[name],
+                "actions_results": actions_results}
+
+        self._result = CheckpointResult(
+            run_id=run_id,
+            run_results=run_results,
+            checkpoint_config=CheckpointConfig(
+                name=f"{combined_suite.expectation_suite_name}_checkpoint",
+                config_version=1,
+                class_name="SimpleCheckpoint"))
+
+    def _run_checkpoint(self, batch_request: RuntimeBatchRequest, suite_name: str) -> None:
+        checkpoint_config = {
+            "name": f"{suite_name}_checkpoint",
+            "config_version": 1,
+            "class_name": "SimpleCheckpoint",
+            "expectation_suite_name": suite_name
+        }
+
+        self.context.add_checkpoint(**checkpoint_config)
+
         self._result = self.context.run_checkpoint(
-            checkpoint_name=f"{self.suite_name}_checkpoint",
+            checkpoint_name=f"{suite_name}_checkpoint",
             validations=[{"batch_request": batch_request}],
-            action_list=[slack_notification],
+            action_list=self._notification_actions(),
             run_name=f"{self.asset_name}"
         )
+        self._suite_results = {
+            suite_name: r for r in self._result.list_validation_results()}
 
     @property
     def result(self) -> CheckpointResult:
+        """Checkpoint result with one validation result per suite"""
         return self._result
 
+    @property
+    def results(self) -> Dict[str, ExpectationSuiteValidationResult]:
+        """Validation result of each suite"""
+        return self._suite_results
+
     @property
     def status(self) -> bool:
-        return self._result['success']
+        return all(r.success for r in self._suite_results.values())
+
+    @property
+    def partition_metrics(self) -> Dict[str, Any]:
+        """Partition sizes and rebalance decision of the last spark run"""
+        return self._partition_metrics
+
+    @property
+    def engine(self) -> str:
+        """Execution engine used by the last run, either spark or pandas"""
+        return self._engine
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field, asdict
 from typing import List, Dict
 
 from ..libs.utils import s3_client
-from .expectations.expectatione_rules import (
+from .expectations.expectations_rule import (
     BaseExpectation,
     CommonFields
 )
@@ -41,10 +41,10 @@ class ValidationSuiteGenerator():
         
         return self
     
-    def save_to_store(self):
+    def save_to_store(self, client: s3_client = None):
         object_s3_path = f"{self.env}/validations/expectations_store/{self.expectation_suite_name}.json"
         
-        s3_client().save_to_s3(
+        (client or s3_client()).save_to_s3(
             data=self._result,
             bucket_name='s3_expectation_bucket_name',
             object_key_name=object_s3_path
@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple, Type
+
+from .expectations_rule import (
+    BaseExpectation,
+    OrderedColumnsMatchExpectation,
+    ColumnsMatchExpectation,
+    RowCountBetweenExpectation,
+    ValuesNotNullExpectation,
+    ColumnCountEqualExpectation,
+    ColumnTypeMatchExpectation,
+    ColumnTypeListMatchExpectation,
+    DateTimeFormatMatchExpectation
+)
+
+COMMON_KWARGS = ("result_format", "include_config", "catch_exceptions")
+
+NUMBER = (int, float)
+## evaluation parameters are given as {"$PARAMETER": ...}
+NUMBER_OR_PARAMETER = (int, float, dict, type(None))
+
+KWARG_TYPES: Dict[str, Tuple[type, ...]] = {
+    "column": (str,),
+    "column_list": (list,),
+    "column_set": (list,),
+    "exact_match": (bool,),
+    "min_value": NUMBER_OR_PARAMETER,
+    "max_value": NUMBER_OR_PARAMETER,
+    "value": (int, dict),
+    "mostly": NUMBER,
+    "type_": (str,),
+    "type_list": (list,),
+    "strftime_format": (str,),
+    "result_format": (str, dict),
+    "include_config": (bool,),
+    "catch_exceptions": (bool,),
+}
+LIST_OF_STR_KWARGS = ("column_list", "column_set", "type_list")
+
+
+@dataclass(frozen=True)
+class ExpectationDescriptor:
+    """Compact description of an expectation type and the kwargs it accepts"""
+    expectation_class: Type[BaseExpectation]
+    required_kwargs: Tuple[str, ...] = ()
+    optional_kwargs: Tuple[str, ...] = ()
+
+    def validate_kwargs(self, kwargs: Dict[str, Any]) -> None:
+        missing = [k for k in self.required_kwargs if k not in kwargs]
+        if missing:
+            raise ValueError(f"Missing required kwargs {missing}")
+
+        allowed = set(self.required_kwargs) | set(self.optional_kwargs) | set(COMMON_KWARGS)
+        unknown = sorted(set(kwargs) - allowed)
+        if unknown:
+            raise ValueError(f"Unknown kwargs {unknown}")
+
+        for name, value in kwargs.items():
+            expected_types = KWARG_TYPES.get(name)
+            if expected_types is None:
+                continue
+
+            ## bool is a subclass of int but never a valid number kwarg
+            is_invalid_bool = isinstance(value, bool) and bool not in expected_types
+            if is_invalid_bool or not isinstance(value, expected_types):
+                raise ValueError(
+                    f"Kwarg {name} must be {' or '.join(t.__name__ for t in expected_types)}, "
+                    f"got {type(value).__name__}")
+
+            if name in LIST_OF_STR_KWARGS and not all(isinstance(v, str) for v in value):
+                raise ValueError(f"Kwarg {name} must be a list of str")
+
+    def build(self, expectation_type: str, kwargs: Dict[str, Any], meta: Dict[str, str] = None) -> BaseExpectation:
+        self.validate_kwargs(kwargs)
+
+        return self.expectation_class(
+            expectation_type=expectation_type,
+            kwargs=dict(kwargs),
+            meta=dict(meta or {})
+        )
+
+
+EXPECTATION_REGISTRY: Dict[str, ExpectationDescriptor] = {
+    "expect_table_columns_to_match_ordered_list": ExpectationDescriptor(
+        OrderedColumnsMatchExpectation, ("column_list",)),
+    "expect_table_columns_to_match_set": ExpectationDescriptor(
+        ColumnsMatchExpectation, ("column_set",), ("exact_match",)),
+    "expect_table_row_count_to_be_between": ExpectationDescriptor(
+        RowCountBetweenExpectation, (), ("min_value", "max_value")),
+    "expect_column_values_to_not_be_null": ExpectationDescriptor(
+        ValuesNotNullExpectation, ("column",), ("mostly",)),
+    "expect_table_column_count_to_equal": ExpectationDescriptor(
+        ColumnCountEqualExpectation, ("value",)),
+    "expect_column_values_to_be_of_type": ExpectationDescriptor(
+        ColumnTypeMatchExpectation, ("column", "type_"), ("mostly",)),
+    "expect_column_values_to_be_in_type_list": ExpectationDescriptor(
+        ColumnTypeListMatchExpectation, ("column", "type_list"), ("mostly",)),
+    "expect_column_values_to_match_strftime_format": ExpectationDescriptor(
+        DateTimeFormatMatchExpectation, ("column", "strftime_format"), ("mostly",)),
+}
+
+
+def get_descriptor(expectation_type: str) -> ExpectationDescriptor:
+    if expectation_type not in EXPECTATION_REGISTRY:
+        raise ValueError(f"Expectation type {expectation_type} is not registered.")
+
+    return EXPECTATION_REGISTRY[expectation_type]
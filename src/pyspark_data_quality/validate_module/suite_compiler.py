@@ -0,0 +1,117 @@
+from __future__ import annotations
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ruamel.yaml import YAML
+
+from ..libs.utils import s3_client
+from .expectation_suit_generator import ValidationSuiteGenerator
+from .expectations.registry import get_descriptor
+
+"""
+Declarative suite definition, in json or yaml:
+
+suites:
+  - name: custom_table_validation_suite
+    expectations:
+      - expectation_type: expect_table_row_count_to_be_between
+        kwargs: {min_value: 10000, max_value: 50000}
+"""
+
+SUITE_FILE_SUFFIXES = (".json", ".yml", ".yaml")
+
+
+@dataclass
+class SuiteCompiler:
+    """Compile declarative suite definition files into validation suites"""
+    env: str = None
+    max_workers: int = 16
+    generators: List[ValidationSuiteGenerator] = field(default_factory=list)
+
+    def _load_file(self, path: Path) -> Dict[str, Any]:
+        with path.open() as f:
+            if path.suffix == ".json":
+                return json.load(f)
+
+            return YAML(typ="safe").load(f)
+
+    def _load_definitions(self, path: Path) -> List[Dict[str, Any]]:
+        content = self._load_file(path) or {}
+        if not isinstance(content, dict) or not isinstance(content.get("suites", []), list):
+            raise ValueError("File must contain a 'suites' list")
+
+        return content.get("suites", [])
+
+    def _compile_suite(self, definition: Dict[str, Any]) -> ValidationSuiteGenerator:
+        vsg = ValidationSuiteGenerator(
+            env=self.env,
+            expectation_suite_name=definition.get("name"))
+
+        for expectation in definition.get("expectations") or []:
+            if not isinstance(expectation, dict):
+                raise ValueError(f"Expectation must be a mapping, got {expectation!r}")
+
+            expectation_type = expectation.get("expectation_type")
+            vsg.add_expectation(
+                get_descriptor(expectation_type).build(
+                    expectation_type=expectation_type,
+                    kwargs=expectation.get("kwargs") or {},
+                    meta=expectation.get("meta")))
+
+        return vsg.build()
+
+    def add_files(self, paths: List[Path]) -> SuiteCompiler:
+        """Compile all suites of the files, every error is reported before raising"""
+        errors = []
+        generators = []
+        suite_names = {vsg.expectation_suite_name for vsg in self.generators}
+
+        for path in paths:
+            path = Path(path)
+            try:
+                definitions = self._load_definitions(path)
+            except Exception as e:
+                errors.append(f"{path}: {e}")
+                continue
+
+            for definition in definitions:
+                if not isinstance(definition, dict):
+                    errors.append(f"{path}: suite must be a mapping, got {definition!r}")
+                    continue
+
+                try:
+                    vsg = self._compile_suite(definition)
+                except Exception as e:
+                    errors.append(f"{path} [{definition.get('name')}]: {e}")
+                    continue
+
+                if vsg.expectation_suite_name in suite_names:
+                    errors.append(f"{path}: duplicated suite {vsg.expectation_suite_name}")
+                    continue
+
+                suite_names.add(vsg.expectation_suite_name)
+                generators.append(vsg)
+
+        if errors:
+            raise ValueError("Invalid suite definitions:\n" + "\n".join(errors))
+
+        self.generators.extend(generators)
+
+        return self
+
+    def add_directory(self, directory: str) -> SuiteCompiler:
+        paths = sorted(
+            p for p in Path(directory).rglob("*") if p.suffix in SUITE_FILE_SUFFIXES)
+
+        return self.add_files(paths)
+
+    def save_to_store(self) -> None:
+        """Upload all compiled suites concurrently with one shared s3 client"""
+        client = s3_client()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(
+                lambda vsg: vsg.save_to_store(client=client), self.generators))
@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+pytest.importorskip("pendulum")
+pytest.importorskip("great_expectations")
+pytest.importorskip("pyspark")
+
+from pyspark_data_quality.validate_module.custom.backfill import BackfillManifest, BackfillRunner
+
+
+class FakeBackfillRunner(BackfillRunner):
+    """Validate dates without spark, the status is looked up from ``outcomes``"""
+
+    def __init__(self, manifest, outcomes):
+        super().__init__(
+            env="test",
+            table_name="custom_table",
+            suite_name="custom_table_validation_suite",
+            load_df=None,
+            manifest=manifest,
+            max_concurrency=2)
+        self.outcomes = outcomes
+        self.validated_dates = []
+
+    def validate_date(self, dt: str) -> bool:
+        self.validated_dates.append(dt)
+        outcome = self.outcomes.get(dt, True)
+        if isinstance(outcome, Exception):
+            raise outcome
+
+        self.manifest.mark_completed(dt, outcome)
+        return outcome
+
+
+def test_dates_are_inclusive():
+    runner = FakeBackfillRunner(BackfillManifest(path="unused.json"), {})
+
+    assert runner.dates("2022-02-27", "2022-03-01") == ["2022-02-27", "2022-02-28", "2022-03-01"]
+
+
+def test_local_manifest_round_trip(tmp_path):
+    path = tmp_path / "nested" / "manifest.json"
+    manifest = BackfillManifest(path=str(path))
+
+    assert manifest.load() == {}
+
+    manifest.mark_completed("2022-06-05", True)
+    manifest.mark_completed("2022-06-06", False)
+
+    assert json.loads(path.read_text()) == {
+        "completed": {"2022-06-05": True, "2022-06-06": False}}
+    assert BackfillManifest(path=str(path)).load() == {"2022-06-05": True, "2022-06-06": False}
+
+
+def test_resume_skips_completed_dates(tmp_path):
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps({"completed": {"2022-06-05": True, "2022-06-06": False}}))
+
+    runner = FakeBackfillRunner(BackfillManifest(path=str(path)), {})
+    statuses = runner.run("2022-06-05", "2022-06-08")
+
+    assert sorted(runner.validated_dates) == ["2022-06-07", "2022-06-08"]
+    assert statuses == {
+        "2022-06-05": True, "2022-06-06": False, "2022-06-07": True, "2022-06-08": True}
+
+
+def test_failed_date_is_reported_and_retried(tmp_path):
+    path = tmp_path / "manifest.json"
+
+    runner = FakeBackfillRunner(
+        BackfillManifest(path=str(path)), {"2022-06-06": RuntimeError("spot instance lost")})
+    statuses = runner.run("2022-06-05", "2022-06-07")
+
+    assert statuses == {"2022-06-05": True, "2022-06-06": None, "2022-06-07": True}
+    assert "2022-06-06" not in BackfillManifest(path=str(path)).load()
+
+    retry_runner = FakeBackfillRunner(BackfillManifest(path=str(path)), {})
+    retry_runner.run("2022-06-05", "2022-06-07")
+
+    assert retry_runner.validated_dates == ["2022-06-06"]
@@ -0,0 +1,52 @@
+import pytest
+
+pytest.importorskip("pyspark")
+
+from pyspark_data_quality.validate_module.custom.partition_balancer import (
+    COALESCE,
+    NO_CHANGE,
+    REPARTITION,
+    PartitionBalancer
+)
+
+
+def test_skewed_small_table_keeps_partition_count():
+    counts = {0: 41000, **{i: 1000 for i in range(1, 10)}}
+
+    metrics = PartitionBalancer().plan(counts, num_partitions=10, parallelism=8)
+
+    assert metrics["decision"] == REPARTITION
+    assert metrics["target_partitions"] == 10
+
+
+def test_skewed_large_table_grows_partitions():
+    counts = {0: 30000000, 1: 1000000, 2: 1000000, 3: 1000000}
+
+    metrics = PartitionBalancer().plan(counts, num_partitions=4, parallelism=8)
+
+    assert metrics["decision"] == REPARTITION
+    assert metrics["target_partitions"] == 33
+
+
+def test_small_partitions_coalesce_down_to_parallelism():
+    counts = {i: 100 for i in range(200)}
+
+    metrics = PartitionBalancer().plan(counts, num_partitions=200, parallelism=8)
+
+    assert metrics["decision"] == COALESCE
+    assert metrics["target_partitions"] == 8
+
+
+def test_balanced_small_table_is_not_coalesced_below_parallelism():
+    counts = {i: 5000 for i in range(10)}
+
+    metrics = PartitionBalancer().plan(counts, num_partitions=10, parallelism=16)
+
+    assert metrics["decision"] == NO_CHANGE
+    assert metrics["target_partitions"] == 10
+
+
+def test_empty_dataframe():
+    metrics = PartitionBalancer().plan({}, num_partitions=10, parallelism=8)
+
+    assert metrics["decision"] == NO_CHANGE
@@ -0,0 +1,121 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("pyspark")
+
+from pyspark.sql.types import DateType, LongType, StringType, StructField, StructType
+
+import pyspark_main
+from pyspark_main import TransformExample
+
+BUCKET = "destination_bucket"
+
+
+class FakeS3Client:
+    """In-memory bucket keeping a log of write operations"""
+    objects = {}
+    operations = []
+
+    def list_object_keys(self, bucket_name, prefix):
+        return sorted(k for b, k in self.objects if b == bucket_name and k.startswith(prefix))
+
+    def list_common_prefixes(self, bucket_name, prefix):
+        return sorted({
+            prefix + k[len(prefix):].split("/")[0] + "/"
+            for k in self.list_object_keys(bucket_name, prefix)
+            if "/" in k[len(prefix):]})
+
+    def copy_object(self, bucket_name, source_key_name, destination_key_name):
+        self.objects[(bucket_name, destination_key_name)] = self.objects[(bucket_name, source_key_name)]
+        self.operations.append(("copy", destination_key_name))
+
+    def delete_objects(self, bucket_name, object_key_names):
+        for key in object_key_names:
+            del self.objects[(bucket_name, key)]
+            self.operations.append(("delete", key))
+
+
+class FakeLogger:
+    def info(self, msg):
+        pass
+
+
+@pytest.fixture
+def transform(monkeypatch):
+    FakeS3Client.objects = {}
+    FakeS3Client.operations = []
+    monkeypatch.setattr(pyspark_main, "s3_client", FakeS3Client)
+
+    return TransformExample(
+        env="develop",
+        spark_session=None,
+        s3_source_bucket="source_bucket",
+        s3_source_prefix="source",
+        s3_destination_bucket=BUCKET,
+        s3_destination_prefix="output",
+        logger=FakeLogger())
+
+
+def put(*keys, content="data"):
+    for key in keys:
+        FakeS3Client.objects[(BUCKET, key)] = content
+
+
+def test_promote_staged_data(transform):
+    put("output/dt=2022-06-04/part-old.parquet",
+        "output/dt=2022-06-05/part-old.parquet",
+        content="old")
+    put("output_staging/_SUCCESS",
+        "output_staging/dt=2022-06-05/part-new.parquet",
+        "output_staging/dt=2022-06-06/part-new.parquet",
+        content="new")
+
+    transform.promote_staged_data()
+
+    assert FakeS3Client.objects == {
+        (BUCKET, "output/dt=2022-06-04/part-old.parquet"): "old",
+        (BUCKET, "output/dt=2022-06-05/part-new.parquet"): "new",
+        (BUCKET, "output/dt=2022-06-06/part-new.parquet"): "new",
+    }
+
+    operations = FakeS3Client.operations
+    assert operations.index(("copy", "output/dt=2022-06-05/part-new.parquet")) \
+        < operations.index(("delete", "output/dt=2022-06-05/part-old.parquet"))
+    assert not any(key.startswith("output/dt=2022-06-04/") for _, key in operations)
+
+
+def test_promote_overwrites_file_with_same_name(transform):
+    put("output/dt=2022-06-05/part-0.parquet", content="old")
+    put("output_staging/dt=2022-06-05/part-0.parquet", content="new")
+
+    transform.promote_staged_data()
+
+    assert FakeS3Client.objects == {(BUCKET, "output/dt=2022-06-05/part-0.parquet"): "new"}
+
+
+def test_load_staged_data_rejects_type_change(transform):
+    expected_schema = StructType([
+        StructField("col1", StringType()), StructField("dt", StringType())])
+    staged_schema = StructType([
+        StructField("col1", StringType()), StructField("dt", DateType())])
+    staged_df = SimpleNamespace(schema=staged_schema, columns=["col1", "dt"])
+    transform.spark_session = SimpleNamespace(read=SimpleNamespace(
+        format=lambda _: SimpleNamespace(load=lambda _: staged_df)))
+
+    with pytest.raises(RuntimeError, match="DateType"):
+        transform.load_staged_data(SimpleNamespace(schema=expected_schema, columns=["col1", "dt"]))
+
+
+def test_load_staged_data_accepts_reordered_columns(transform):
+    expected_schema = StructType([
+        StructField("col1", StringType()), StructField("col2", LongType())])
+    staged_schema = StructType([
+        StructField("col2", LongType()), StructField("col1", StringType())])
+    staged_df = SimpleNamespace(
+        schema=staged_schema, columns=["col2", "col1"], select=lambda cols: cols)
+    transform.spark_session = SimpleNamespace(read=SimpleNamespace(
+        format=lambda _: SimpleNamespace(load=lambda _: staged_df)))
+
+    assert transform.load_staged_data(
+        SimpleNamespace(schema=expected_schema, columns=["col1", "col2"])) == ["col1", "col2"]
@@ -0,0 +1,42 @@
+import pytest
+
+from pyspark_data_quality.validate_module.expectations.expectations_rule import (
+    RowCountBetweenExpectation,
+    ValuesNotNullExpectation
+)
+from pyspark_data_quality.validate_module.expectations.registry import get_descriptor
+
+
+def test_build_registered_expectation():
+    expectation = get_descriptor("expect_column_values_to_not_be_null").build(
+        expectation_type="expect_column_values_to_not_be_null",
+        kwargs={"column": "col1", "mostly": 0.9})
+
+    assert isinstance(expectation, ValuesNotNullExpectation)
+    assert expectation.kwargs == {"column": "col1", "mostly": 0.9}
+
+
+def test_optional_kwargs_only():
+    expectation = get_descriptor("expect_table_row_count_to_be_between").build(
+        expectation_type="expect_table_row_count_to_be_between",
+        kwargs={"min_value": 1})
+
+    assert isinstance(expectation, RowCountBetweenExpectation)
+
+
+def test_unregistered_expectation_type():
+    with pytest.raises(ValueError, match="not registered"):
+        get_descriptor("expect_something_unknown")
+
+
+@pytest.mark.parametrize("expectation_type, kwargs, message", [
+    ("expect_column_values_to_not_be_null", {}, "Missing required kwargs"),
+    ("expect_column_values_to_not_be_null", {"column": "col1", "columns": "col2"}, "Unknown kwargs"),
+    ("expect_table_columns_to_match_ordered_list", {"column_list": "col1"}, "column_list must be list"),
+    ("expect_table_columns_to_match_set", {"column_set": ["col1", 2]}, "list of str"),
+    ("expect_table_row_count_to_be_between", {"min_value": "1"}, "min_value must be"),
+    ("expect_table_column_count_to_equal", {"value": True}, "value must be"),
+])
+def test_invalid_kwargs(expectation_type, kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        get_descriptor(expectation_type).validate_kwargs(kwargs)
@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+pytest.importorskip("boto3")
+pytest.importorskip("ruamel.yaml")
+
+from pyspark_data_quality.validate_module.suite_compiler import SuiteCompiler
+
+YAML_SUITES = """
+suites:
+  - name: custom_table_validation_suite
+    expectations:
+      - expectation_type: expect_table_row_count_to_be_between
+        kwargs: {min_value: 10000, max_value: 50000}
+      - expectation_type: expect_column_values_to_not_be_null
+        kwargs: {column: col1}
+"""
+
+
+def test_yaml_and_json_definitions_compile_to_same_suite(tmp_path):
+    (tmp_path / "suites.yaml").write_text(YAML_SUITES)
+    (tmp_path / "suites.json").write_text(json.dumps({
+        "suites": [{
+            "name": "other_table_validation_suite",
+            "expectations": [
+                {"expectation_type": "expect_table_row_count_to_be_between",
+                 "kwargs": {"min_value": 10000, "max_value": 50000}},
+                {"expectation_type": "expect_column_values_to_not_be_null",
+                 "kwargs": {"column": "col1"}},
+            ]
+        }]
+    }))
+
+    compiler = SuiteCompiler(env="develop").add_directory(str(tmp_path))
+    results = {vsg.expectation_suite_name: vsg._result for vsg in compiler.generators}
+
+    assert set(results) == {"custom_table_validation_suite", "other_table_validation_suite"}
+    assert results["custom_table_validation_suite"]["expectations"] \
+        == results["other_table_validation_suite"]["expectations"]
+    assert results["custom_table_validation_suite"]["expectations"][0] == {
+        "expectation_type": "expect_table_row_count_to_be_between",
+        "kwargs": {"min_value": 10000, "max_value": 50000},
+        "meta": {}}
+
+
+def test_duplicated_suite_names(tmp_path):
+    (tmp_path / "a.yaml").write_text(YAML_SUITES)
+    (tmp_path / "b.yaml").write_text(YAML_SUITES)
+
+    compiler = SuiteCompiler(env="develop")
+    with pytest.raises(ValueError, match="duplicated suite custom_table_validation_suite"):
+        compiler.add_directory(str(tmp_path))
+
+    assert compiler.generators == []
+
+
+def test_every_error_is_reported(tmp_path):
+    (tmp_path / "broken.json").write_text("{not json")
+    (tmp_path / "invalid.yaml").write_text("""
+suites:
+  - not_a_mapping
+  - name: missing_kwargs_suite
+    expectations:
+      - expectation_type: expect_column_values_to_not_be_null
+        kwargs: {}
+  - name: unknown_kwargs_suite
+    expectations:
+      - expectation_type: expect_column_values_to_not_be_null
+        kwargs: {column: col1, colum: col1}
+""")
+
+    with pytest.raises(ValueError) as e:
+        SuiteCompiler(env="develop").add_directory(str(tmp_path))
+
+    message = str(e.value)
+    assert "broken.json" in message
+    assert "suite must be a mapping" in message
+    assert "[missing_kwargs_suite]: Missing required kwargs ['column']" in message
+    assert "[unknown_kwargs_suite]: Unknown kwargs ['colum']" in message
@@ -0,0 +1,285 @@
+from types import SimpleNamespace
+from typing import Any, Dict
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("great_expectations")
+pytest.importorskip("pyspark")
+
+from great_expectations.core import ExpectationConfiguration
+
+from pyspark_data_quality.validate_module.custom import validator as validator_module
+from pyspark_data_quality.validate_module.custom.s3_data_context import S3Context
+
+
+class InMemoryContext(S3Context):
+    """S3Context with in-memory stores and no data docs site"""
+
+    def stores(self) -> Dict[str, Any]:
+        return {
+            name: {"class_name": class_name, "store_backend": {"class_name": "InMemoryStoreBackend"}}
+            for name, class_name in [
+                (self.expectations_store_name, "ExpectationsStore"),
+                (self.validations_store_name, "ValidationsStore"),
+                (self.checkpoints_store_name, "CheckpointStore")]
+        } | {self.evaluation_store_name: {"class_name": "EvaluationParameterStore"}}
+
+    def data_docs(self) -> Dict[str, Dict[str, Any]]:
+        return {}
+
+
+class PandasValidator(validator_module.Validator):
+    def _select_engine(self) -> str:
+        return validator_module.PANDAS_ENGINE
+
+    def _to_pandas(self):
+        return self.df
+
+    def _notification_actions(self):
+        return []
+
+
+@pytest.fixture
+def validator_factory(monkeypatch):
+    class FakeSsmClient:
+        def get_parameter_value(self, *args, **kwargs):
+            return "token"
+
+    monkeypatch.setattr(validator_module, "S3Context", InMemoryContext)
+    monkeypatch.setattr(validator_module, "ssm_client", FakeSsmClient)
+
+    def factory(suites, df, validator_class=PandasValidator):
+        validator = validator_class(
+            df=df,
+            asset_name="custom_table_2022-06-05",
+            suite_name=list(suites),
+            env="test")
+        for name, expectations in suites.items():
+            suite = validator.context.create_expectation_suite(name)
+            for expectation_type, kwargs in expectations:
+                suite.add_expectation(ExpectationConfiguration(
+                    expectation_type=expectation_type, kwargs=kwargs))
+            validator.context.save_expectation_suite(suite)
+
+        return validator
+
+    return factory
+
+
+def test_run_overlapping_suites(validator_factory):
+    row_count = ("expect_table_row_count_to_be_between", {"min_value": 1, "max_value": 10})
+    validator = validator_factory(
+        suites={
+            "schema_suite": [
+                row_count,
+                ("expect_table_columns_to_match_set", {"column_set": ["col1", "col2"]})],
+            "business_suite": [
+                row_count,
+                ("expect_column_values_to_not_be_null", {"column": "col2"})],
+        },
+        df=pd.DataFrame({"col1": ["a", "b", "c"], "col2": [1, None, 3]}))
+
+    validator.run()
+
+    assert set(validator.results) == {"schema_suite", "business_suite"}
+    assert validator.results["schema_suite"].success
+    assert not validator.results["business_suite"].success
+    assert validator.results["business_suite"].statistics["successful_expectations"] == 1
+    assert [r.expectation_config.expectation_type
+            for r in validator.results["schema_suite"].results] == [
+        "expect_table_row_count_to_be_between",
+        "expect_table_columns_to_match_set"]
+    assert not validator.status
+
+    assert len(validator.result.list_validation_results()) == 2
+    assert not validator.result.success
+    stored_keys = validator.context.validations_store.list_keys()
+    assert {k.expectation_suite_identifier.expectation_suite_name for k in stored_keys} == {
+        "schema_suite", "business_suite"}
+
+
+def test_run_overlapping_suites_with_evaluation_parameters(validator_factory):
+    row_count = ("expect_table_row_count_to_be_between",
+                 {"min_value": {"$PARAMETER": "2 - 1"}, "max_value": 10})
+    validator = validator_factory(
+        suites={
+            "schema_suite": [
+                row_count,
+                ("expect_table_columns_to_match_set", {"column_set": ["col1"]})],
+            "sla_suite": [row_count],
+        },
+        df=pd.DataFrame({"col1": ["a", "b", "c"]}))
+
+    validator.run()
+
+    assert validator.status
+    assert validator.results["sla_suite"].statistics["evaluated_expectations"] == 1
+    assert validator.results["sla_suite"].results[0].result["observed_value"] == 3
+    assert validator.results["schema_suite"].statistics["successful_expectations"] == 2
+
+
+class FakeConf:
+    def __init__(self, values):
+        self.values = dict(values)
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def set(self, key, value):
+        self.values[key] = value
+
+    def unset(self, key):
+        self.values.pop(key, None)
+
+
+class FakeSparkDataFrame:
+    """Stand-in for a spark DataFrame recording the arrow conf seen by toPandas"""
+
+    def __init__(self, conf, error=None):
+        self.sql_ctx = SimpleNamespace(sparkSession=SimpleNamespace(conf=conf))
+        self.error = error
+        self.arrow_enabled = None
+
+    def toPandas(self):
+        self.arrow_enabled = self.sql_ctx.sparkSession.conf.get(validator_module.ARROW_ENABLED_CONF)
+        if self.error is not None:
+            raise self.error
+
+        return pd.DataFrame({"col1": ["a"]})
+
+
+ROW_COUNT_SUITE = {
+    "row_count_suite": [
+        ("expect_table_row_count_to_be_between", {"min_value": 1, "max_value": 10})]}
+
+
+@pytest.mark.parametrize("plan_statistics, engine", [
+    ((100, 10 * 1024 * 1024 * 1024), validator_module.PANDAS_ENGINE),
+    ((1000000, 1024), validator_module.SPARK_ENGINE),
+    ((None, 100 * 1024), validator_module.PANDAS_ENGINE),
+    ((None, 2 * 1024 * 1024), validator_module.SPARK_ENGINE),
+    ((None, None), validator_module.SPARK_ENGINE),
+])
+def test_select_engine(validator_factory, plan_statistics, engine):
+    validator = validator_factory(ROW_COUNT_SUITE, df=None, validator_class=validator_module.Validator)
+    validator._plan_statistics = lambda: plan_statistics
+
+    assert validator._select_engine() == engine
+
+
+def test_spark_typed_expectations_stay_on_spark_engine(validator_factory):
+    validator = validator_factory(
+        suites={
+            **ROW_COUNT_SUITE,
+            "type_suite": [
+                ("expect_column_values_to_be_of_type", {"column": "col1", "type_": "StringType"})]},
+        df=None,
+        validator_class=validator_module.Validator)
+    validator._plan_statistics = lambda: (100, 1024)
+
+    assert validator._select_engine() == validator_module.SPARK_ENGINE
+
+
+@pytest.mark.parametrize("previous", [None, "false"])
+def test_to_pandas_restores_arrow_conf(validator_factory, previous):
+    values = {} if previous is None else {validator_module.ARROW_ENABLED_CONF: previous}
+    conf = FakeConf(values)
+    validator = validator_factory(ROW_COUNT_SUITE, df=None, validator_class=validator_module.Validator)
+    validator.df = FakeSparkDataFrame(conf)
+
+    validator._to_pandas()
+
+    assert validator.df.arrow_enabled == "true"
+    assert conf.values == values
+
+
+def test_to_pandas_restores_arrow_conf_on_error(validator_factory):
+    conf = FakeConf({})
+    validator = validator_factory(ROW_COUNT_SUITE, df=None, validator_class=validator_module.Validator)
+    validator.df = FakeSparkDataFrame(conf, error=RuntimeError("driver out of memory"))
+
+    with pytest.raises(RuntimeError):
+        validator._to_pandas()
+
+    assert conf.values == {}
+
+
+class FakeCachedDataFrame:
+    def __init__(self, name, is_cached=False):
+        self.name = name
+        self.is_cached = is_cached
+        self.events = []
+
+    def persist(self):
+        self.is_cached = True
+        self.events.append("persist")
+        return self
+
+    def unpersist(self):
+        self.is_cached = False
+        self.events.append("unpersist")
+        return self
+
+    def count(self):
+        self.events.append("count")
+        return 0
+
+
+class FakeBalancer:
+    def __init__(self, balanced_df=None):
+        self.balanced_df = balanced_df
+
+    def balance(self, df):
+        return self.balanced_df or df, {"decision": "repartition" if self.balanced_df else "none"}
+
+
+@pytest.fixture
+def spark_validator(validator_factory):
+    validator = validator_factory(ROW_COUNT_SUITE, df=None, validator_class=validator_module.Validator)
+    validator._select_engine = lambda: validator_module.SPARK_ENGINE
+
+    def run_suites(batch_request):
+        batch_data = batch_request.runtime_parameters["batch_data"]
+        validator.validated_df = (batch_data.name, batch_data.is_cached)
+
+    validator._run_suites = validator._run_checkpoint = lambda batch_request, *args: run_suites(batch_request)
+
+    return validator
+
+
+def test_rebalanced_copy_is_persisted_and_validated(spark_validator):
+    input_df = FakeCachedDataFrame("input")
+    balanced_df = FakeCachedDataFrame("balanced")
+    spark_validator.df = input_df
+    spark_validator.partition_balancer = FakeBalancer(balanced_df)
+
+    spark_validator.run()
+
+    assert spark_validator.validated_df == ("balanced", True)
+    assert balanced_df.events == ["persist", "count", "unpersist"]
+    assert input_df.events == ["persist", "unpersist"]
+
+
+def test_unchanged_input_is_persisted_during_validation(spark_validator):
+    input_df = FakeCachedDataFrame("input")
+    spark_validator.df = input_df
+    spark_validator.partition_balancer = FakeBalancer()
+
+    spark_validator.run()
+
+    assert spark_validator.validated_df == ("input", True)
+    assert input_df.events == ["persist", "unpersist"]
+
+
+def test_cached_input_is_left_cached(spark_validator):
+    input_df = FakeCachedDataFrame("input", is_cached=True)
+    balanced_df = FakeCachedDataFrame("balanced")
+    spark_validator.df = input_df
+    spark_validator.partition_balancer = FakeBalancer(balanced_df)
+
+    spark_validator.run()
+
+    assert input_df.events == []
+    assert input_df.is_cached
+    assert not balanced_df.is_cached